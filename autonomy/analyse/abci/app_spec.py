@@ -405,7 +405,7 @@ class DFA:
     def abci_to_dfa(cls, abci_app_cls: Any, label: str = "") -> "DFA":
         """Translates an AbciApp class into a DFA."""
 
-        trf = abci_app_cls.transition_function
+        rounds, transitions = get_rounds_and_transitions(abci_app_cls)
 
         label = label if label != "" else abci_app_cls.__name__
         default_start_state = abci_app_cls.initial_round_cls.__name__
@@ -416,17 +416,11 @@ class DFA:
         final_states = DFA._norep_list_to_set(
             [s.__name__ for s in abci_app_cls.final_states]
         )
-        states = (
-            DFA._norep_list_to_set([k.__name__ for k in trf])
-            | {s.__name__ for k in trf for s in trf[k].values()}
-            | start_states
-            | final_states
-        )
-        alphabet_in = {str(s).rsplit(".", 1)[1] for k in trf for s in trf[k].keys()}
+        states = {s.__name__ for s in rounds} | start_states | final_states
+        alphabet_in = {str(e).rsplit(".", 1)[1] for _, e in transitions}
         transition_func = {
-            (k.__name__, str(s).rsplit(".", 1)[1]): trf[k][s].__name__
-            for k in trf
-            for s in trf[k]
+            (k.__name__, str(e).rsplit(".", 1)[1]): next_round.__name__
+            for (k, e), next_round in transitions.items()
         }
         transition_func = OrderedDict(sorted(transition_func.items()))
         return cls(
@@ -440,6 +434,32 @@ class DFA:
         )
 
 
+def get_rounds_and_transitions(
+    abci_app_cls: Any,
+) -> Tuple[Set[Any], Dict[Tuple[Any, Any], Any]]:
+    """
+    Get the rounds and the `(round, event) -> next round` transitions of an AbciApp.
+
+    The lookup tables which are precomputed by the `AbciApp` class are used if they are available,
+    otherwise, e.g., for apps built on older versions of the framework, they are derived from the transition function.
+
+    :param abci_app_cls: the AbciApp class.
+    :return: the rounds and the transitions of the app.
+    """
+    get_transition_tables = getattr(abci_app_cls, "get_transition_tables", None)
+    if get_transition_tables is not None:
+        tables = get_transition_tables()
+        return set(tables.rounds), dict(tables.transitions)
+
+    trf = abci_app_cls.transition_function
+    transitions = {
+        (round_cls, event): next_round_cls
+        for round_cls, round_transitions in trf.items()
+        for event, next_round_cls in round_transitions.items()
+    }
+    return set(trf).union(transitions.values()), transitions
+
+
 def check_unreferenced_events(abci_app_cls: Any) -> List[str]:
     """Checks for unreferenced events in the AbciApp.
 
@@ -30,16 +30,16 @@ import sys
 import textwrap
 import uuid
 from abc import ABC, ABCMeta, abstractmethod
-from collections import Counter, deque
+from collections import Counter
 from copy import copy, deepcopy
 from dataclasses import asdict, astuple, dataclass, field, is_dataclass
 from enum import Enum
 from inspect import isclass
 from math import ceil
+from types import MappingProxyType
 from typing import (
     Any,
     Callable,
-    Deque,
     Dict,
     FrozenSet,
     Generic,
@@ -531,6 +531,8 @@ class AbciAppDB:
         )
         self._cross_period_check()
         self.slashing_config: str = ""
+        self._version = 0
+        self._cached_values: Dict[Any, Any] = {}
 
     def _cross_period_check(self) -> None:
         """Check the cross period keys against the setup data."""
@@ -608,6 +610,16 @@ class AbciAppDB:
         """Keys in the database which are persistent across periods."""
         return self._cross_period_persisted_keys
 
+    @property
+    def version(self) -> int:
+        """Get the version of the data, which is incremented every time that the data are modified."""
+        return self._version
+
+    def _modified(self) -> None:
+        """Increment the version of the data and invalidate the values which have been cached for the previous one."""
+        self._version += 1
+        self._cached_values.clear()
+
     def get(self, key: str, default: Any = VALUE_NOT_PROVIDED) -> Optional[Any]:
         """Given a key, get its last for the current reset index."""
         if key in self._data[self.reset_index]:
@@ -643,6 +655,7 @@ class AbciAppDB:
         data = self._data[self.reset_index]
         for key, value in deepcopy(kwargs).items():
             data.setdefault(key, []).append(value)
+        self._modified()
 
     def create(self, **kwargs: Any) -> None:
         """Add a new entry to the data.
@@ -670,6 +683,7 @@ class AbciAppDB:
         """Add a new entry to the data using the provided key-value pairs."""
         AbciAppDB._check_data(kwargs)
         self._data[self.reset_index + 1] = deepcopy(kwargs)
+        self._modified()
 
     def get_latest_from_reset_index(self, reset_index: int) -> Dict[str, Any]:
         """Get the latest key-value pairs from the data dictionary for the specified period."""
@@ -707,6 +721,7 @@ class AbciAppDB:
             key: self._data[key]
             for key in sorted(self._data.keys())[-cleanup_history_depth:]
         }
+        self._modified()
         if cleanup_history_depth_current:
             self.cleanup_current_histories(cleanup_history_depth_current)
 
@@ -719,6 +734,7 @@ class AbciAppDB:
             key: history[-cleanup_history_depth_current:]
             for key, history in self._data[self.reset_index].items()
         }
+        self._modified()
 
     def serialize(self) -> str:
         """Serialize the data of the database to a string."""
@@ -770,6 +786,7 @@ class AbciAppDB:
         self._check_data(dict(tuple(db_data.values())[0]))
         self._data = db_data
         self.slashing_config = slashing_config
+        self._modified()
 
     def hash(self) -> bytes:
         """Create a hash of the data."""
@@ -791,6 +808,42 @@ SerializedCollection = Dict[str, Dict[str, Any]]
 DeserializedCollection = Mapping[str, BaseTxPayload]
 
 
+class cached_db_property(property):  # pylint: disable=invalid-name
+    """
+    A property of the synchronized data, which is cached until the underlying `AbciAppDB` is modified.
+
+    The value is computed at most once per version of the database and synchronized data class,
+    and it is shared by all the synchronized data instances which wrap the same database.
+    Therefore, a decorated property should only depend on the contents of the database.
+    A shallow copy of the cached value is returned on every access, which is a no-op for immutable values.
+
+    Usage:
+
+        class SynchronizedData(BaseSynchronizedData):
+
+            @cached_db_property
+            def my_collection(self) -> DeserializedCollection:
+                serialized = self.db.get_strict("my_collection")
+                return CollectionRound.deserialize_collection(serialized)
+    """
+
+    def __get__(self, instance: Any, owner: Optional[Type] = None) -> Any:
+        """Get the cached value of the property, computing it if necessary."""
+        if instance is None:
+            return self
+
+        fget = cast(Callable[[Any], Any], self.fget)
+        cached_values = getattr(instance.db, "_cached_values", None)
+        if not isinstance(cached_values, dict):
+            # the database does not support caching, e.g., it is mocked
+            return fget(instance)
+
+        key = (type(instance), fget)
+        if key not in cached_values:
+            cached_values[key] = fget(instance)
+        return copy(cached_values[key])
+
+
 class BaseSynchronizedData:
     """
     Class to represent the synchronized data.
@@ -846,7 +899,7 @@ class BaseSynchronizedData:
         """
         return self.db.reset_index
 
-    @property
+    @cached_db_property
     def participants(self) -> FrozenSet[str]:
         """Get the currently active participants."""
         participants = frozenset(self.db.get_strict("participants"))
@@ -854,7 +907,7 @@ class BaseSynchronizedData:
             raise ValueError("List participants cannot be empty.")
         return cast(FrozenSet[str], participants)
 
-    @property
+    @cached_db_property
     def all_participants(self) -> FrozenSet[str]:
         """Get all registered participants."""
         all_participants = frozenset(self.db.get_strict("all_participants"))
@@ -862,22 +915,22 @@ class BaseSynchronizedData:
             raise ValueError("List participants cannot be empty.")
         return cast(FrozenSet[str], all_participants)
 
-    @property
+    @cached_db_property
     def max_participants(self) -> int:
         """Get the number of all the participants."""
         return len(self.all_participants)
 
-    @property
+    @cached_db_property
     def consensus_threshold(self) -> int:
         """Get the consensus threshold."""
         threshold = self.db.get_strict("consensus_threshold")
-        min_threshold = consensus_threshold(self.max_participants)
+        max_threshold = self.max_participants
+        min_threshold = consensus_threshold(max_threshold)
 
         if threshold is None:
             return min_threshold
 
         threshold = int(threshold)
-        max_threshold = len(self.all_participants)
 
         if min_threshold <= threshold <= max_threshold:
             return threshold
@@ -889,7 +942,7 @@ class BaseSynchronizedData:
         )
         raise ValueError(f"Consensus threshold {threshold} {expected_range}.")
 
-    @property
+    @cached_db_property
     def sorted_participants(self) -> Sequence[str]:
         """
         Get the sorted participants' addresses.
@@ -903,7 +956,7 @@ class BaseSynchronizedData:
         """
         return sorted(self.participants, key=str.lower)
 
-    @property
+    @cached_db_property
     def nb_participants(self) -> int:
         """Get the number of participants."""
         participants = cast(List, self.db.get("participants", []))
@@ -969,27 +1022,27 @@ class BaseSynchronizedData:
         """Check whether keeper is set."""
         return self.db.get("most_voted_keeper_address", None) is not None
 
-    @property
+    @cached_db_property
     def blacklisted_keepers(self) -> Set[str]:
         """Get the current cycle's blacklisted keepers who cannot submit a transaction."""
         raw = cast(str, self.db.get("blacklisted_keepers", ""))
         return set(textwrap.wrap(raw, ADDRESS_LENGTH))
 
-    @property
+    @cached_db_property
     def participant_to_selection(self) -> DeserializedCollection:
         """Check whether keeper is set."""
         serialized = self.db.get_strict("participant_to_selection")
         deserialized = CollectionRound.deserialize_collection(serialized)
         return cast(DeserializedCollection, deserialized)
 
-    @property
+    @cached_db_property
     def participant_to_randomness(self) -> DeserializedCollection:
         """Check whether keeper is set."""
         serialized = self.db.get_strict("participant_to_randomness")
         deserialized = CollectionRound.deserialize_collection(serialized)
         return cast(DeserializedCollection, deserialized)
 
-    @property
+    @cached_db_property
     def participant_to_votes(self) -> DeserializedCollection:
         """Check whether keeper is set."""
         serialized = self.db.get_strict("participant_to_votes")
@@ -1989,6 +2042,8 @@ class _MetaAbciApp(ABCMeta):
             mcs.bg_round_added = True
 
         mcs._check_consistency(cast(Type[AbciApp], new_cls))
+        # precompute the lookup tables of the transition function
+        cast(Type[AbciApp], new_cls).get_transition_tables()
 
         return new_cls
 
@@ -2322,6 +2377,82 @@ class TransitionBackup:
     transition_function: Optional[AbciAppTransitionFunction] = None
 
 
+@dataclass(frozen=True)
+class AbciAppTransitionTables:
+    """
+    Immutable lookup tables derived from the transition function of an `AbciApp`.
+
+    The tables are built once per `AbciApp` class and are meant to be shared by every component which needs to
+    inspect the structure of an application (e.g., the round sequence, the behaviours, or the analysis tools),
+    so that it does not need to be derived from the transition function over and over again.
+    """
+
+    round_id_to_cls: Mapping[str, AppState]
+    transitions: Mapping[Tuple[AppState, Any], AppState]
+    event_to_timeout: Mapping[Any, float]
+    states: FrozenSet[AppState]
+    rounds: FrozenSet[AppState]
+    events: FrozenSet[Any]
+    _source: Tuple[Any, ...] = field(repr=False, compare=False)
+
+    @staticmethod
+    def _get_source(
+        transition_function: AbciAppTransitionFunction,
+        event_to_timeout: EventToTimeout,
+    ) -> Tuple[Any, ...]:
+        """Get the source of the tables, along with the shape of the transition function."""
+        return (
+            transition_function,
+            event_to_timeout,
+            len(transition_function),
+            sum(map(len, transition_function.values())),
+        )
+
+    @classmethod
+    def build(
+        cls,
+        transition_function: AbciAppTransitionFunction,
+        event_to_timeout: EventToTimeout,
+    ) -> "AbciAppTransitionTables":
+        """Build the tables from a transition function and a mapping of the events to their timeouts."""
+        transitions = {
+            (round_cls, event): next_round_cls
+            for round_cls, round_transitions in transition_function.items()
+            for event, next_round_cls in round_transitions.items()
+        }
+        return cls(
+            round_id_to_cls=MappingProxyType(
+                {
+                    round_cls.auto_round_id(): round_cls
+                    for round_cls in transition_function
+                }
+            ),
+            transitions=MappingProxyType(transitions),
+            event_to_timeout=MappingProxyType(event_to_timeout),
+            states=frozenset(transition_function),
+            rounds=frozenset(transition_function).union(transitions.values()),
+            events=frozenset(event for _, event in transitions),
+            _source=cls._get_source(transition_function, event_to_timeout),
+        )
+
+    def is_stale(
+        self,
+        transition_function: AbciAppTransitionFunction,
+        event_to_timeout: EventToTimeout,
+    ) -> bool:
+        """Check whether the tables do not reflect the given transition function and events' timeouts anymore."""
+        source = self._get_source(transition_function, event_to_timeout)
+        return (
+            source[0] is not self._source[0]
+            or source[1] is not self._source[1]
+            or source[2:] != self._source[2:]
+        )
+
+    def get_next_round_cls(self, round_cls: AppState, event: Any) -> Optional[AppState]:
+        """Get the round which follows the given round on the given event."""
+        return self.transitions.get((round_cls, event), None)
+
+
 class AbciApp(
     Generic[EventType], ABC, metaclass=_MetaAbciApp
 ):  # pylint: disable=too-many-instance-attributes
@@ -2342,6 +2473,7 @@ class AbciApp(
     db_pre_conditions: Dict[AppState, Set[str]] = {}
     db_post_conditions: Dict[AppState, Set[str]] = {}
     _is_abstract: bool = True
+    _transition_tables: Optional[AbciAppTransitionTables] = None
 
     def __init__(
         self,
@@ -2416,18 +2548,37 @@ class AbciApp(
         )
         return result
 
+    @classmethod
+    def get_transition_tables(cls) -> AbciAppTransitionTables:
+        """
+        Get the lookup tables of the app's transition function.
+
+        The tables are built when the class is created, and are only rebuilt if the transition function
+        or the events' timeouts are replaced, or if rounds or events are added to the transition function.
+
+        :return: the lookup tables.
+        """
+        tables = cast(
+            Optional[AbciAppTransitionTables], cls.__dict__.get("_transition_tables")
+        )
+        if tables is None or tables.is_stale(
+            cls.transition_function, cls.event_to_timeout
+        ):
+            tables = AbciAppTransitionTables.build(
+                cls.transition_function, cls.event_to_timeout
+            )
+            cls._transition_tables = tables
+        return tables
+
     @classmethod
     def get_all_rounds(cls) -> Set[AppState]:
         """Get all the round states."""
-        return set(cls.transition_function)
+        return set(cls.get_transition_tables().states)
 
     @classmethod
     def get_all_events(cls) -> Set[EventType]:
         """Get all the events."""
-        events: Set[EventType] = set()
-        for _, transitions in cls.transition_function.items():
-            events.update(transitions.keys())
-        return events
+        return set(cls.get_transition_tables().events)
 
     @staticmethod
     def _get_rounds_from_transition_function(
@@ -2449,7 +2600,7 @@ class AbciApp(
         include_background_rounds: bool = False,
     ) -> Set[AppState]:
         """Get all round classes."""
-        full_fn = deepcopy(cls.transition_function)
+        rounds = set(cls.get_transition_tables().rounds)
 
         if include_background_rounds:
             for app in cls.background_apps:
@@ -2460,9 +2611,11 @@ class AbciApp(
                     transition_fn = cast(
                         AbciAppTransitionFunction, app.transition_function
                     )
-                    full_fn.update(transition_fn)
+                    rounds.update(
+                        cls._get_rounds_from_transition_function(transition_fn)
+                    )
 
-        return cls._get_rounds_from_transition_function(full_fn)
+        return rounds
 
     @property
     def bg_apps_prioritized(self) -> Tuple[List[BackgroundApp], ...]:
@@ -2706,9 +2859,7 @@ class AbciApp(
             self._transition_backup.round = self._current_round
             self._transition_backup.round_cls = self._current_round_cls
             # we switch the current transition function, with the background app's transition function
-            self._transition_backup.transition_function = deepcopy(
-                self.transition_function
-            )
+            self._transition_backup.transition_function = self.transition_function
             self.transition_function = app.transition_function
             self.logger.info(
                 f"The {event} event was produced, transitioning to "
@@ -2741,7 +2892,7 @@ class AbciApp(
                     AbciAppTransitionFunction,
                     self._transition_backup.transition_function,
                 )
-                self.transition_function = deepcopy(backup_fn)
+                self.transition_function = backup_fn
                 self._transition_backup.transition_function = None
                 self._switched = True
                 self.logger.info(
@@ -2758,6 +2909,11 @@ class AbciApp(
         self._adjust_transition_fn(event)
 
         current_round_cls = cast(AppState, self._current_round_cls)
+        if self.transition_function is type(self).transition_function:
+            return self.get_transition_tables().get_next_round_cls(
+                current_round_cls, event
+            )
+
         next_round_cls = self.transition_function[current_round_cls].get(event, None)
         if next_round_cls is None:
             return None
@@ -2919,8 +3075,20 @@ class AvailabilityWindow:
     the oldest element is removed. Two attributes `num_positive` and `num_negative`
     reflect the number of positive and negative elements in the AvailabilityWindow,
     they are updated every time a new element is added.
+
+    The array is stored as an integer bitset, where the least significant bit is the most recently added value.
+    This keeps both the updates and the serialization of the window cheap, even for large windows.
     """
 
+    __slots__ = (
+        "_max_length",
+        "_mask",
+        "_array",
+        "_length",
+        "_num_positive",
+        "_num_negative",
+    )
+
     def __init__(self, max_length: int) -> None:
         """
         Initializes the `AvailabilityWindow` instance.
@@ -2933,16 +3101,34 @@ class AvailabilityWindow:
             )
 
         self._max_length = max_length
-        self._window: Deque[bool] = deque(maxlen=max_length)
+        self._mask = (1 << max_length) - 1
+        self._array = 0
+        self._length = 0
         self._num_positive = 0
         self._num_negative = 0
 
     def __eq__(self, other: Any) -> bool:
         """Compare `AvailabilityWindow` objects."""
         if isinstance(other, AvailabilityWindow):
-            return self.to_dict() == other.to_dict()
+            return self.snapshot() == other.snapshot()
         return False
 
+    def __len__(self) -> int:
+        """Get the number of elements in the window."""
+        return self._length
+
+    def __getitem__(self, index: int) -> bool:
+        """Get the element at the given index, where `0` is the oldest element and `-1` the latest."""
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("AvailabilityWindow index out of range")
+        return bool(self._array >> (self._length - 1 - index) & 1)
+
+    def snapshot(self) -> Tuple[int, int, int, int]:
+        """Get a hashable snapshot of the window's serializable state."""
+        return self._max_length, self._array, self._num_positive, self._num_negative
+
     def has_bad_availability_rate(self, threshold: float = 0.95) -> bool:
         """Whether the agent on which the window belongs to has a bad availability rate or not."""
         return self._num_positive >= ceil(self._max_length * threshold)
@@ -2968,13 +3154,16 @@ class AvailabilityWindow:
 
         :param value: The boolean value to add to the cyclic array.
         """
-        if len(self._window) == self._max_length and self._max_length > 0:
+        value = bool(value)
+        if self._length == self._max_length:
             # we have filled the window, we need to pop the oldest element
             # and update the score accordingly
-            oldest_value = self._window.popleft()
+            oldest_value = bool(self._array >> (self._max_length - 1) & 1)
             self._update_counters(oldest_value, removal=True)
+        else:
+            self._length += 1
 
-        self._window.append(value)
+        self._array = ((self._array << 1) | value) & self._mask
         self._update_counters(value)
 
     def to_dict(self) -> Dict[str, int]:
@@ -2982,11 +3171,7 @@ class AvailabilityWindow:
         return {
             "max_length": self._max_length,
             # Please note that the value cannot be represented if the max length of the availability window is > 14_285
-            "array": (
-                int("".join(str(int(flag)) for flag in self._window), base=2)
-                if len(self._window)
-                else 0
-            ),
+            "array": self._array,
             "num_positive": self._num_positive,
             "num_negative": self._num_negative,
         }
@@ -3034,38 +3219,98 @@ class AvailabilityWindow:
         """Initializes an `AvailabilityWindow` instance from a dictionary."""
         cls._validate(data)
 
-        # convert the serialized array to a binary string
-        binary_number = bin(data["array"])[2:]
-        # convert each character in the binary string to a flag
-        flags = (bool(int(digit)) for digit in binary_number)
-
         instance = cls(max_length=data["max_length"])
-        instance._window.extend(flags)
+        instance._array = data["array"]
+        # the serialized array does not hold the leading negative flags, apart from a single one if it is empty
+        instance._length = max(data["array"].bit_length(), 1)
         instance._num_positive = data["num_positive"]
         instance._num_negative = data["num_negative"]
         return instance
 
 
-@dataclass
 class OffenceStatus:
     """A class that holds information about offence status for an agent."""
 
-    validator_downtime: AvailabilityWindow = field(
-        default_factory=lambda: AvailabilityWindow(NUMBER_OF_BLOCKS_TRACKED)
-    )
-    invalid_payload: AvailabilityWindow = field(
-        default_factory=lambda: AvailabilityWindow(NUMBER_OF_ROUNDS_TRACKED)
+    __slots__ = (
+        "validator_downtime",
+        "invalid_payload",
+        "blacklisted",
+        "suspected",
+        "num_unknown_offenses",
+        "num_double_signed",
+        "num_light_client_attack",
+        "custom_offences_amount",
     )
-    blacklisted: AvailabilityWindow = field(
-        default_factory=lambda: AvailabilityWindow(NUMBER_OF_ROUNDS_TRACKED)
-    )
-    suspected: AvailabilityWindow = field(
-        default_factory=lambda: AvailabilityWindow(NUMBER_OF_ROUNDS_TRACKED)
-    )
-    num_unknown_offenses: int = 0
-    num_double_signed: int = 0
-    num_light_client_attack: int = 0
-    custom_offences_amount: int = 0
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        validator_downtime: Optional[AvailabilityWindow] = None,
+        invalid_payload: Optional[AvailabilityWindow] = None,
+        blacklisted: Optional[AvailabilityWindow] = None,
+        suspected: Optional[AvailabilityWindow] = None,
+        num_unknown_offenses: int = 0,
+        num_double_signed: int = 0,
+        num_light_client_attack: int = 0,
+        custom_offences_amount: int = 0,
+    ) -> None:
+        """Initialize the offence status."""
+        self.validator_downtime = (
+            AvailabilityWindow(NUMBER_OF_BLOCKS_TRACKED)
+            if validator_downtime is None
+            else validator_downtime
+        )
+        self.invalid_payload = (
+            AvailabilityWindow(NUMBER_OF_ROUNDS_TRACKED)
+            if invalid_payload is None
+            else invalid_payload
+        )
+        self.blacklisted = (
+            AvailabilityWindow(NUMBER_OF_ROUNDS_TRACKED)
+            if blacklisted is None
+            else blacklisted
+        )
+        self.suspected = (
+            AvailabilityWindow(NUMBER_OF_ROUNDS_TRACKED)
+            if suspected is None
+            else suspected
+        )
+        self.num_unknown_offenses = num_unknown_offenses
+        self.num_double_signed = num_double_signed
+        self.num_light_client_attack = num_light_client_attack
+        self.custom_offences_amount = custom_offences_amount
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare `OffenceStatus` objects."""
+        if isinstance(other, OffenceStatus):
+            return self.snapshot() == other.snapshot()
+        return False
+
+    def __repr__(self) -> str:
+        """Get the string representation of the offence status."""
+        attributes = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self.__slots__
+        )
+        return f"{self.__class__.__name__}({attributes})"
+
+    def snapshot(self) -> Tuple[Any, ...]:
+        """Get a hashable snapshot of the status, which changes only if its serialization changes."""
+        return (
+            self.validator_downtime.snapshot(),
+            self.invalid_payload.snapshot(),
+            self.blacklisted.snapshot(),
+            self.suspected.snapshot(),
+            self.num_unknown_offenses,
+            self.num_double_signed,
+            self.num_light_client_attack,
+            self.custom_offences_amount,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns a dictionary representation of the `OffenceStatus` instance."""
+        return {
+            name: (value.to_dict() if isinstance(value, AvailabilityWindow) else value)
+            for name, value in ((name, getattr(self, name)) for name in self.__slots__)
+        }
 
     def slash_amount(self, light_unit_amount: int, serious_unit_amount: int) -> int:
         """Get the slash amount of the current status."""
@@ -3101,10 +3346,10 @@ class OffenseStatusEncoder(json.JSONEncoder):
 
     def default(self, o: Any) -> Any:
         """The default JSON encoder."""
+        if isinstance(o, (AvailabilityWindow, OffenceStatus)):
+            return o.to_dict()
         if is_dataclass(o):
             return asdict(o)
-        if isinstance(o, AvailabilityWindow):
-            return o.to_dict()
         return super().default(o)
 
 
@@ -3117,7 +3362,7 @@ class OffenseStatusDecoder(json.JSONDecoder):
 
     @staticmethod
     def hook(
-        data: Dict[str, Any]
+        data: Dict[str, Any],
     ) -> Union[AvailabilityWindow, OffenceStatus, Dict[str, OffenceStatus]]:
         """Perform the custom decoding."""
         # if this is an `AvailabilityWindow`
@@ -3126,10 +3371,7 @@ class OffenseStatusDecoder(json.JSONDecoder):
             return AvailabilityWindow.from_dict(data)
 
         # if this is an `OffenceStatus`
-        status_attributes = (
-            OffenceStatus.__annotations__.keys()  # pylint: disable=no-member
-        )
-        if sorted(status_attributes) == sorted(data.keys()):
+        if sorted(OffenceStatus.__slots__) == sorted(data.keys()):
             return OffenceStatus(**data)
 
         return data
@@ -3217,6 +3459,8 @@ class RoundSequence:  # pylint: disable=too-many-instance-attributes
         self._validator_to_agent: Dict[str, str] = {}
         # a mapping of the agents' addresses to their offence status
         self._offence_status: Dict[str, OffenceStatus] = {}
+        # a mapping of the agents' addresses to a snapshot of their offence status and its serialization
+        self._serialized_status_cache: Dict[str, Tuple[Tuple[Any, ...], str]] = {}
         self._slashing_enabled = False
         self.pending_offences: Set[PendingOffense] = set()
 
@@ -3284,8 +3528,33 @@ class RoundSequence:  # pylint: disable=too-many-instance-attributes
             )
 
     def serialized_offence_status(self) -> str:
-        """Serialize the offence status."""
-        return json.dumps(self.offence_status, cls=OffenseStatusEncoder, sort_keys=True)
+        """
+        Serialize the offence status.
+
+        The result is identical to `json.dumps(self.offence_status, cls=OffenseStatusEncoder, sort_keys=True)`.
+        However, the encoded status of each agent is cached along with a snapshot of it,
+        and only the statuses which have changed since the last serialization are encoded again.
+
+        :return: the serialized offence status.
+        """
+        offence_status = self.offence_status
+        cache = self._serialized_status_cache
+        for removed_agent in cache.keys() - offence_status.keys():
+            del cache[removed_agent]
+
+        encoded_items = []
+        for agent in sorted(offence_status):
+            status = offence_status[agent]
+            snapshot = status.snapshot()
+            cached = cache.get(agent)
+            if cached is None or cached[0] != snapshot:
+                encoded_status = json.dumps(
+                    status, cls=OffenseStatusEncoder, sort_keys=True
+                )
+                cached = cache[agent] = (snapshot, encoded_status)
+            encoded_items.append(f"{json.dumps(agent)}: {cached[1]}")
+
+        return "{" + ", ".join(encoded_items) + "}"
 
     def store_offence_status(self) -> None:
         """Store the serialized offence status."""
@@ -3507,33 +3776,35 @@ class RoundSequence:  # pylint: disable=too-many-instance-attributes
         self, evidences: Evidences, last_commit_info: LastCommitInfo
     ) -> None:
         """Track offences provided by Tendermint, if there are any."""
+        offence_status = self.offence_status
         for vote_info in last_commit_info.votes:
             agent_address = self.get_agent_address(vote_info.validator)
             was_down = not vote_info.signed_last_block
-            self.offence_status[agent_address].validator_downtime.add(was_down)
+            offence_status[agent_address].validator_downtime.add(was_down)
 
         for byzantine_validator in evidences.byzantine_validators:
             agent_address = self.get_agent_address(byzantine_validator.validator)
             evidence_type = byzantine_validator.evidence_type
-            self.offence_status[agent_address].num_unknown_offenses += bool(
+            agent_status = offence_status[agent_address]
+            agent_status.num_unknown_offenses += bool(
                 evidence_type == EvidenceType.UNKNOWN
             )
-            self.offence_status[agent_address].num_double_signed += bool(
+            agent_status.num_double_signed += bool(
                 evidence_type == EvidenceType.DUPLICATE_VOTE
             )
-            self.offence_status[agent_address].num_light_client_attack += bool(
+            agent_status.num_light_client_attack += bool(
                 evidence_type == EvidenceType.LIGHT_CLIENT_ATTACK
             )
 
     def _track_app_offences(self) -> None:
         """Track offences provided by the app level, if there are any."""
         synced_data = self.abci_app.synchronized_data
-        for agent in self.offence_status.keys():
-            blacklisted = agent in synced_data.blacklisted_keepers
-            suspected = agent in cast(tuple, synced_data.db.get("suspects", tuple()))
-            agent_status = self.offence_status[agent]
-            agent_status.blacklisted.add(blacklisted)
-            agent_status.suspected.add(suspected)
+        # retrieve the blacklisted and suspected agents once per block, instead of once per agent
+        blacklisted_agents = synced_data.blacklisted_keepers
+        suspected_agents = cast(tuple, synced_data.db.get("suspects", tuple()))
+        for agent, agent_status in self.offence_status.items():
+            agent_status.blacklisted.add(agent in blacklisted_agents)
+            agent_status.suspected.add(agent in suspected_agents)
 
     def _handle_slashing_not_configured(self, exc: SlashingNotConfiguredError) -> None:
         """Handle a `SlashingNotConfiguredError`."""
@@ -3771,9 +4042,14 @@ class RoundSequence:  # pylint: disable=too-many-instance-attributes
             self._last_round_transition_root_hash = self.root_hash
 
         self.abci_app.cleanup_timeouts()
-        round_id_to_cls = {
-            cls.auto_round_id(): cls for cls in self.abci_app.transition_function
-        }
+        abci_app = self.abci_app
+        round_id_to_cls: Mapping[str, AppState]
+        if abci_app.transition_function is type(abci_app).transition_function:
+            round_id_to_cls = abci_app.get_transition_tables().round_id_to_cls
+        else:
+            round_id_to_cls = {
+                cls.auto_round_id(): cls for cls in abci_app.transition_function
+            }
         restart_from_round_cls = round_id_to_cls.get(restart_from_round, None)
         if restart_from_round_cls is None:
             raise ABCIAppInternalError(
@@ -27,6 +27,7 @@ import pprint
 import re
 import sys
 from abc import ABC, ABCMeta, abstractmethod
+from concurrent.futures import Future
 from enum import Enum
 from functools import partial
 from typing import (
@@ -36,6 +37,7 @@ from typing import (
     Generator,
     List,
     Optional,
+    Set,
     Tuple,
     Type,
     Union,
@@ -577,6 +579,7 @@ class BaseBehaviour(
         self._is_healthy: bool = False
         self._non_200_return_code_count: int = 0
         self.gentle_reset_attempted: bool = False
+        self._pending_futures: Set[Future] = set()
 
     @classmethod
     def auto_behaviour_id(cls) -> str:
@@ -693,6 +696,44 @@ class BaseBehaviour(
 
         yield from self.wait_for_condition(_wait_until)
 
+    def run_in_executor(
+        self, fn: Callable[..., Any], *args: Any, timeout: Optional[float] = None
+    ) -> Generator[None, None, Any]:
+        """
+        Run a CPU-heavy function in the shared state's executor, without blocking the agent's main loop.
+
+        The executor is a thread or a process pool, depending on the `executor_type` param.
+        When using a process pool, the function and its arguments need to be picklable.
+        If the behaviour is stopped or cleaned up, the work is cancelled if it has not started yet,
+        otherwise its result is discarded.
+
+        :param fn: the function to run.
+        :param args: the positional arguments to pass to the function.
+        :param timeout: the maximum amount of time to wait for the result.
+        :return: the result of the function.
+        :yield: None
+        """
+        future = self.shared_state.executor.submit(fn, *args)
+        self._pending_futures.add(future)
+        try:
+            yield from self.wait_for_condition(future.done, timeout=timeout)
+        finally:
+            # in case the generator is closed or the timeout expires, the work is not needed anymore
+            future.cancel()
+            self._pending_futures.discard(future)
+        return future.result()
+
+    def clean_up(self) -> None:
+        """
+        Clean up the resources due to a 'stop' event.
+
+        It cancels any work scheduled via `run_in_executor` which has not started yet.
+        Concrete classes overriding this method should call it via `super`.
+        """
+        for future in self._pending_futures:
+            future.cancel()
+        self._pending_futures.clear()
+
     def is_done(self) -> bool:
         """Check whether the behaviour is done."""
         return self._is_done
@@ -97,7 +97,10 @@ class RandomnessBehaviour(BaseBehaviour, ABC):
         observation = self.context.randomness_api.process_response(response)
         if observation is not None:
             self.context.logger.info("Verifying DRAND values...")
-            check, error = drand_check.verify(observation, self.params.drand_public_key)
+            # the BLS signature verification is CPU-heavy, therefore it is run outside the agent's main loop
+            check, error = yield from self.run_in_executor(
+                drand_check.verify, observation, self.params.drand_public_key
+            )
             if check:
                 self.context.logger.info("DRAND check successful.")
             else:
@@ -155,6 +158,7 @@ class RandomnessBehaviour(BaseBehaviour, ABC):
 
         It can be optionally implemented by the concrete classes.
         """
+        super().clean_up()
         self.context.randomness_api.reset_retries()
 
 
@@ -23,6 +23,7 @@ import inspect
 import json
 from abc import ABC, ABCMeta
 from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -69,6 +70,11 @@ NUMBER_OF_RETRIES: int = 5
 DEFAULT_BACKOFF_FACTOR: float = 2.0
 DEFAULT_TYPE_NAME: str = "str"
 DEFAULT_CHAIN = "ethereum"
+DEFAULT_EXECUTOR_TYPE = "thread"
+EXECUTOR_TYPES: Dict[str, Type[Executor]] = {
+    "thread": ThreadPoolExecutor,
+    "process": ProcessPoolExecutor,
+}
 
 
 class FrozenMixin:  # pylint: disable=too-few-public-methods
@@ -321,6 +327,15 @@ class BaseParams(
         self.setup_params: Dict[str, Any] = self._ensure("setup", kwargs, dict)
         # TODO add to all configs
         self.default_chain_id: str = kwargs.get("default_chain_id", DEFAULT_CHAIN)
+        # the pool used by the behaviours to offload CPU-heavy work, see `BaseBehaviour.run_in_executor`
+        self.executor_type: str = kwargs.get("executor_type", DEFAULT_EXECUTOR_TYPE)
+        enforce(
+            self.executor_type in EXECUTOR_TYPES,
+            f"`executor_type` must be one of {list(EXECUTOR_TYPES)}, but got {self.executor_type!r}.",
+        )
+        self.executor_max_workers: Optional[int] = kwargs.get(
+            "executor_max_workers", None
+        )
 
         # we sanitize for null values as these are just kept for schema definitions
         skill_id = kwargs["skill_context"].skill_id
@@ -441,6 +456,7 @@ class SharedState(Model, ABC, metaclass=_MetaSharedState):  # type: ignore
         self.tm_recovery_params: TendermintRecoveryParams = TendermintRecoveryParams(
             self.abci_app_cls.initial_round_cls.auto_round_id()
         )
+        self._executor: Optional[Executor] = None
         kwargs["skill_context"] = skill_context
         super().__init__(*args, **kwargs)
 
@@ -514,6 +530,21 @@ class SharedState(Model, ABC, metaclass=_MetaSharedState):  # type: ignore
                 self.synchronized_data.all_participants
             )
 
+    def teardown(self) -> None:
+        """Tear down the model."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    @property
+    def executor(self) -> Executor:
+        """Get the pool which is used to run CPU-heavy work outside the agent's main loop, creating it if needed."""
+        if self._executor is None:
+            params = cast(BaseParams, self.context.params)
+            executor_cls = EXECUTOR_TYPES[params.executor_type]
+            self._executor = executor_cls(max_workers=params.executor_max_workers)
+        return self._executor
+
     @property
     def round_sequence(self) -> RoundSequence:
         """Get the round_sequence."""
@@ -20,6 +20,7 @@
 """Tests for valory/abstract_round_abci skill's behaviours."""
 import json
 from abc import ABC
+from concurrent.futures import wait
 from copy import copy
 from enum import Enum
 from pathlib import Path
@@ -385,6 +386,12 @@ class FSMBehaviourBaseCase(BaseSkillTestCase, ABC):
             ),
         )
 
+    def complete_executor_work(self) -> None:
+        """Wait for the work that the current behaviour has scheduled via `run_in_executor` and resume the behaviour."""
+        current_behaviour = cast(BaseBehaviour, self.behaviour.current_behaviour)
+        wait(current_behaviour._pending_futures)
+        self.behaviour.act_wrapper()
+
     def end_round(self, done_event: Enum) -> None:
         """Ends round early to cover `wait_for_end` generator."""
         current_behaviour = cast(BaseBehaviour, self.behaviour.current_behaviour)
@@ -107,6 +107,7 @@ class BaseRandomnessBehaviourTest(CommonBaseCase):
         )
 
         self.behaviour.act_wrapper()
+        self.complete_executor_work()
         self.mock_a2a_transaction()
         self._test_done_flag_set()
         self.end_round(self.done_event)
@@ -150,6 +151,8 @@ class BaseRandomnessBehaviourTest(CommonBaseCase):
                 body=json.dumps(drand_value).encode(),
             ),
         )
+        self.behaviour.act_wrapper()
+        self.complete_executor_work()
 
     def test_invalid_response(
         self,
@@ -1046,6 +1046,49 @@ class TestBaseSynchronizedData:
         """Test 'participants' property getter."""
         assert len(self.participants) == self.base_synchronized_data.nb_participants
 
+    def test_cached_db_property(self) -> None:
+        """Test that the cached properties are invalidated when the db is modified."""
+        db = self.base_synchronized_data.db
+        version = db.version
+        with mock.patch.object(
+            db, "get_strict", wraps=db.get_strict
+        ) as get_strict_mock:
+            assert self.base_synchronized_data.participants == frozenset(
+                self.participants
+            )
+            assert self.base_synchronized_data.participants == frozenset(
+                self.participants
+            )
+            get_strict_mock.assert_called_once_with("participants")
+
+            db.update(participants=("c",))
+            assert db.version == version + 1
+            assert self.base_synchronized_data.participants == frozenset({"c"})
+            assert get_strict_mock.call_count == 2
+
+        # the cache is shared between the synchronized data instances using the same db
+        other_synchronized_data = BaseSynchronizedData(db=db)
+        with mock.patch.object(db, "get_strict") as get_strict_mock:
+            assert other_synchronized_data.participants == frozenset({"c"})
+            get_strict_mock.assert_not_called()
+
+    def test_cached_db_property_returns_copy(self) -> None:
+        """Test that mutating a cached mutable value does not affect the cache."""
+        self.base_synchronized_data.db.update(blacklisted_keepers="")
+        blacklisted_keepers = self.base_synchronized_data.blacklisted_keepers
+        blacklisted_keepers.add("a")
+        assert self.base_synchronized_data.blacklisted_keepers == set()
+
+    def test_cached_db_property_mocked_db(self) -> None:
+        """Test that the cache is bypassed if the db does not support caching."""
+        db_mock = mock.MagicMock()
+        db_mock.get_strict.return_value = self.participants
+        base_synchronized_data = BaseSynchronizedData(db=db_mock)
+        assert base_synchronized_data.participants == frozenset(self.participants)
+        assert base_synchronized_data.participants == frozenset(self.participants)
+        assert db_mock.get_strict.call_count == 2
+        assert isinstance(BaseSynchronizedData.participants, property)
+
     def test_participants_getter_negative(self) -> None:
         """Test 'participants' property getter, negative case."""
         base_synchronized_data = BaseSynchronizedData(db=AbciAppDB(setup_data={}))
@@ -1794,6 +1837,43 @@ class TestAbciApp:
         self.abci_app.update_time(current_time)
         assert height == self.abci_app.current_round_height
 
+    def test_get_transition_tables(self) -> None:
+        """Test the lookup tables of the transition function."""
+        tables = AbciAppTest.get_transition_tables()
+        # the tables are precomputed when the class is created and then reused
+        assert AbciAppTest.__dict__["_transition_tables"] is tables
+        assert AbciAppTest.get_transition_tables() is tables
+        assert tables.round_id_to_cls == {
+            round_cls.auto_round_id(): round_cls
+            for round_cls in (ConcreteRoundA, ConcreteRoundB, ConcreteRoundC)
+        }
+        assert tables.get_next_round_cls(ConcreteRoundA, ConcreteEvents.B) is (
+            ConcreteRoundB
+        )
+        assert tables.get_next_round_cls(ConcreteRoundB, ConcreteEvents.A) is None
+        assert tables.events == frozenset(self.abci_app.get_all_events())
+        assert tables.event_to_timeout == AbciAppTest.event_to_timeout
+        with pytest.raises(TypeError):
+            tables.transitions[(ConcreteRoundB, ConcreteEvents.A)] = ConcreteRoundA  # type: ignore
+
+    def test_get_transition_tables_rebuilt(self) -> None:
+        """Test that the lookup tables are rebuilt if the transition function is extended."""
+
+        class ExtendedAbciApp(AbciAppTest):
+            """An AbciApp whose transition function is extended after its creation."""
+
+            transition_function = deepcopy(AbciAppTest.transition_function)
+
+        tables = ExtendedAbciApp.get_transition_tables()
+        assert tables is not AbciAppTest.get_transition_tables()
+        ExtendedAbciApp.transition_function[ConcreteBackgroundRound] = {
+            ConcreteEvents.TERMINATE: ConcreteRoundA
+        }
+        rebuilt_tables = ExtendedAbciApp.get_transition_tables()
+        assert rebuilt_tables is not tables
+        assert ConcreteBackgroundRound in rebuilt_tables.states
+        assert ConcreteEvents.TERMINATE in rebuilt_tables.events
+
     def test_get_all_events(self) -> None:
         """Test the all events getter."""
         assert {
@@ -2034,22 +2114,22 @@ class TestAvailabilityWindow:
             value = hypothesis_data.draw(booleans())
             availability_window.add(value)
             items_in = i + 1
-            assert len(availability_window._window) == items_in
-            assert availability_window._window[-1] is value
+            assert len(availability_window) == items_in
+            assert availability_window[-1] is value
+            assert availability_window._array & 1 == value
             expected_positives += 1 if value else 0
             assert availability_window._num_positive == expected_positives
             expected_negatives = items_in - expected_positives
             assert availability_window._num_negative == expected_negatives
 
         # max length is reached and window starts cycling
-        assert len(availability_window._window) == max_length
+        assert len(availability_window) == max_length
         for _ in range(10):
             value = hypothesis_data.draw(booleans())
-            expected_popped_value = (
-                None if max_length == 0 else availability_window._window[0]
-            )
+            expected_popped_value = None if max_length == 0 else availability_window[0]
             availability_window.add(value)
-            assert len(availability_window._window) == max_length
+            assert len(availability_window) == max_length
+            assert availability_window._array < 2**max_length
             if expected_popped_value is not None:
                 expected_positives -= bool(expected_popped_value)
                 expected_negatives -= bool(not expected_popped_value)
@@ -2090,10 +2170,12 @@ class TestAvailabilityWindow:
         expected_serialization: int,
     ) -> None:
         """Test `to_dict` method."""
+        max_length = max(max_length, len(window))
         availability_window = AvailabilityWindow(max_length)
+        for flag in window:
+            availability_window.add(flag)
         availability_window._num_positive = num_positive
         availability_window._num_negative = num_negative
-        availability_window._window = window
         assert availability_window.to_dict() == {
             "max_length": max_length,
             "array": expected_serialization,
@@ -2183,7 +2265,7 @@ class TestAvailabilityWindow:
         expected_window = deque(flags, maxlen=data_["max_length"])
 
         assert availability_window._max_length == data_["max_length"]
-        assert availability_window._window == expected_window
+        assert list(availability_window) == list(expected_window)
         assert availability_window._num_positive == data_["num_positive"]
         assert availability_window._num_negative == data_["num_negative"]
 
@@ -2451,16 +2533,16 @@ class TestRoundSequence:
         else:
             mock_loads.assert_not_called()
 
-    @mock.patch("json.dumps")
+    @mock.patch.object(RoundSequence, "serialized_offence_status")
     @pytest.mark.parametrize("slashing_enabled", (True, False))
     def test_store_offence_status(
-        self, mock_dumps: mock.MagicMock, slashing_enabled: bool
+        self, mock_serialized_offence_status: mock.MagicMock, slashing_enabled: bool
     ) -> None:
         """Test the `store_offence_status` method."""
         # Set up mock objects and return values
         self.round_sequence._offence_status = {"not_encoded": OffenceStatus()}
         mock_encoded_status = "encoded_status"
-        mock_dumps.return_value = mock_encoded_status
+        mock_serialized_offence_status.return_value = mock_encoded_status
 
         self.round_sequence._slashing_enabled = slashing_enabled
 
@@ -2468,12 +2550,8 @@ class TestRoundSequence:
         self.round_sequence.store_offence_status()
 
         if slashing_enabled:
-            # Check that `json.dumps()` was called with the correct arguments, only if slashing is enabled
-            mock_dumps.assert_called_once_with(
-                self.round_sequence.offence_status,
-                cls=OffenseStatusEncoder,
-                sort_keys=True,
-            )
+            # Check that the status was serialized, only if slashing is enabled
+            mock_serialized_offence_status.assert_called_once_with()
             assert (
                 self.round_sequence.abci_app.synchronized_data.db.slashing_config
                 == mock_encoded_status
@@ -2481,7 +2559,35 @@ class TestRoundSequence:
             return
 
         # otherwise check that it was not called
-        mock_dumps.assert_not_called()
+        mock_serialized_offence_status.assert_not_called()
+
+    @given(dictionaries(keys=text(), values=offence_status(), min_size=2))
+    def test_serialized_offence_status(
+        self, offense_status: Dict[str, OffenceStatus]
+    ) -> None:
+        """Test that the `serialized_offence_status` method only re-encodes the changed statuses."""
+        round_sequence = RoundSequence(context=MagicMock(), abci_app_cls=AbciAppTest)
+        round_sequence._offence_status = offense_status
+
+        def expected_serialization() -> str:
+            """Get the expected serialization."""
+            return json.dumps(offense_status, cls=OffenseStatusEncoder, sort_keys=True)
+
+        assert round_sequence.serialized_offence_status() == expected_serialization()
+
+        changed_agent = sorted(offense_status)[0]
+        offense_status[changed_agent].num_unknown_offenses += 1
+        with mock.patch.object(
+            OffenseStatusEncoder, "default", wraps=OffenseStatusEncoder().default
+        ) as default_mock:
+            serialized = round_sequence.serialized_offence_status()
+        assert serialized == expected_serialization()
+        # only the status of the changed agent is encoded again
+        default_mock.assert_called_once_with(offense_status[changed_agent])
+
+        del offense_status[changed_agent]
+        assert round_sequence.serialized_offence_status() == expected_serialization()
+        assert changed_agent not in round_sequence._serialized_status_cache
 
     @given(
         validator=builds(Validator, address=binary(), power=integers()),
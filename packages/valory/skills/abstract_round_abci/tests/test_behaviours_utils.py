@@ -22,8 +22,10 @@
 import json
 import logging
 import platform
+import threading
 import time
 from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
@@ -791,6 +793,66 @@ class TestBaseBehaviour:
         self.behaviour.set_done()
         assert self.behaviour.is_done()
 
+    def test_run_in_executor(self) -> None:
+        """Test 'run_in_executor' method."""
+        event = threading.Event()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            self.behaviour.context.state.executor = executor
+            gen = self.behaviour.run_in_executor(lambda x: event.wait() and x, 1)
+            # the work has not finished, therefore the generator yields
+            try_send(gen)
+            try_send(gen)
+            assert len(self.behaviour._pending_futures) == 1
+            event.set()
+            executor.shutdown(wait=True)
+            with pytest.raises(StopIteration) as e:
+                gen.send(None)
+            assert e.value.value == 1
+            assert not self.behaviour._pending_futures
+
+    def test_run_in_executor_timeout(self) -> None:
+        """Test 'run_in_executor' method when the timeout expires."""
+        event = threading.Event()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            self.behaviour.context.state.executor = executor
+            gen = self.behaviour.run_in_executor(event.wait, timeout=0.01)
+            try:
+                time.sleep(0.02)
+                with pytest.raises(TimeoutException):
+                    gen.send(None)
+                assert not self.behaviour._pending_futures
+            finally:
+                event.set()
+
+    def test_run_in_executor_clean_up(self) -> None:
+        """Test that 'clean_up' cancels the work which has not started yet."""
+        event = threading.Event()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            self.behaviour.context.state.executor = executor
+            # occupy the only worker, so that the next work remains pending
+            executor.submit(event.wait)
+            gen = self.behaviour.run_in_executor(lambda: None)
+            try_send(gen)
+            (future,) = self.behaviour._pending_futures
+            self.behaviour.clean_up()
+            assert future.cancelled()
+            assert not self.behaviour._pending_futures
+            event.set()
+
+    def test_run_in_executor_stop(self) -> None:
+        """Test that closing the generator cancels the work which has not started yet."""
+        event = threading.Event()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            self.behaviour.context.state.executor = executor
+            executor.submit(event.wait)
+            gen = self.behaviour.run_in_executor(lambda: None)
+            try_send(gen)
+            (future,) = self.behaviour._pending_futures
+            gen.close()
+            assert future.cancelled()
+            assert not self.behaviour._pending_futures
+            event.set()
+
     @mock.patch.object(BaseBehaviour, "_send_transaction")
     def test_send_a2a_transaction_positive(self, *_: Any) -> None:
         """Test 'send_a2a_transaction' method, positive case."""
@@ -134,6 +134,14 @@ def dummy_generator(
     return dummy_generator_wrapped
 
 
+def run_inline(
+    _: Any, fn: Callable[..., ReturnValueType], *args: Any
+) -> Generator[None, None, ReturnValueType]:
+    """A dummy `run_in_executor` which runs the given function without yielding."""
+    return fn(*args)
+    yield  # pylint: disable=unreachable
+
+
 def last_iteration(gen: Generator) -> None:
     """Perform a generator iteration and ensure that it is the last one."""
     with pytest.raises(StopIteration):
@@ -204,6 +212,10 @@ class TestRandomnessBehaviour(BaseDummyBehaviour):
             VerifyDrand,
             "verify",
             return_value=(verified, "Error message."),
+        ), mock.patch.object(
+            DummyRandomnessBehaviour,
+            "run_in_executor",
+            run_inline,
         ):
             next(gen)
             try:
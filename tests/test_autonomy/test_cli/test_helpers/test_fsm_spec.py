@@ -30,6 +30,7 @@ from autonomy.analyse.abci.app_spec import (
     DFA,
     DFASpecificationError,
     FSMSpecificationLoader,
+    get_rounds_and_transitions,
 )
 from autonomy.cli.helpers.fsm_spec import (
     check_all,
@@ -40,6 +41,7 @@ from autonomy.cli.helpers.fsm_spec import (
 
 import packages
 from packages.valory.skills import offend_abci, test_abci
+from packages.valory.skills.test_abci.rounds import TestAbciApp
 
 from tests.conftest import ROOT_DIR
 
@@ -166,3 +168,14 @@ def test_check_all_raises() -> None:
         expected = "Specifications check for following packages failed."
         with pytest.raises(DFASpecificationError, match=expected):
             check_all(package_dir)
+
+
+def test_get_rounds_and_transitions_without_tables() -> None:
+    """Test that the rounds and the transitions are derived from the transition function if the tables are missing."""
+
+    expected = get_rounds_and_transitions(TestAbciApp)
+    abci_app_cls = mock.Mock(
+        spec=["transition_function"],
+        transition_function=TestAbciApp.transition_function,
+    )
+    assert get_rounds_and_transitions(abci_app_cls) == expected